@@ -0,0 +1,67 @@
+import gc
+import pickle
+import unittest
+import weakref
+
+from data_extractor import DataExtractor
+
+
+class TestExtractAllCache(unittest.TestCase):
+    """Tests for the per-extractor extract_all cache."""
+
+    def test_cached_results_are_fresh_lists(self):
+        extractor = DataExtractor()
+        first = extractor.extract_all("Mail user@example.com")
+        first['emails'].append('tampered')
+        self.assertEqual(extractor.extract_all("Mail user@example.com")['emails'], ['user@example.com'])
+
+    def test_cache_is_bounded(self):
+        extractor = DataExtractor()
+        for i in range(DataExtractor._CACHE_SIZE + 10):
+            extractor.extract_all(f"#tag{i}")
+        self.assertEqual(len(extractor._cache), DataExtractor._CACHE_SIZE)
+
+    def test_extractor_freed_by_refcount(self):
+        extractor = DataExtractor()
+        extractor.extract_all("x" * 1000 + " user@example.com")
+        ref = weakref.ref(extractor)
+        gc.disable()
+        try:
+            del extractor
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+    def test_pickle_round_trip(self):
+        extractor = DataExtractor()
+        text = "Call (555) 123-4567 at 2:30 PM"
+        expected = extractor.extract_all(text)
+        clone = pickle.loads(pickle.dumps(extractor))
+        self.assertNotIn('_cache', clone.__dict__)
+        self.assertEqual(clone.extract_all(text), expected)
+
+
+class TestStreaming(unittest.TestCase):
+    """Tests for the chunked stream_* extractors."""
+
+    def test_matches_spanning_chunks(self):
+        extractor = DataExtractor()
+        text = 'Mail user@example.com or see <a href="https://example.com/page">docs</a>'
+        chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+        self.assertEqual(list(extractor.stream_emails(chunks, overlap=64)), extractor.get_emails(text))
+        self.assertEqual(list(extractor.stream_urls(chunks, overlap=64)), extractor.get_urls(text))
+        self.assertEqual(list(extractor.stream_html_tags(chunks, overlap=64)), extractor.get_html_tags(text))
+
+    def test_long_match_does_not_grow_window(self):
+        extractor = DataExtractor()
+        chunks = ['https://x.com/'] + ['a' * 1000] * 50 + [' #end']
+        self.assertEqual(list(extractor.stream_urls(chunks, overlap=16)), [])
+
+    def test_overlap_must_be_positive(self):
+        extractor = DataExtractor()
+        with self.assertRaises(ValueError):
+            extractor.stream_emails(["a@b.co", "m x"], overlap=0)
+
+
+if __name__ == "__main__":
+    unittest.main()